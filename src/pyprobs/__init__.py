@@ -1,4 +1,5 @@
 from ._version import __version__
 from .probability import Probability
+from .async_probability import AsyncProbability
 
-__all__ = ["Probability"]
+__all__ = ["Probability", "AsyncProbability"]
@@ -0,0 +1,191 @@
+import asyncio
+from . import exceptions
+from .probability import Probability
+from typing import Union, Optional, Dict, List, Tuple, AsyncIterator
+
+
+class AsyncProbability(object):
+    """
+    The AsyncProbability class wraps a Probability instance for asyncio code.
+
+    The ``decide`` calls for the same probability share batched draws: the values are drawn
+    ``batch`` at a time in one pass and handed out to the calls one by one, so the concurrent
+    calls don't pay the cost of a full ``iprob`` call each and don't wait for the event loop.
+    A value is added to the history of the wrapped instance only when it is handed out,
+    so the history and count_values work as if every call was an ``iprob`` call.
+
+    Functions:
+
+    - decide
+    - stream
+
+    Note: The probabilities are batched by type and value, so 1 and 1.0 are drawn separately,
+    but they share a history entry as they do with iprob. bool values are not accepted.
+
+    Examples
+    ----------
+
+    >>> import asyncio
+    >>> from pyprobs import AsyncProbability
+    >>> ap = AsyncProbability()
+    >>> async def main():
+    ...     return await asyncio.gather(*(ap.decide("3/7") for _ in range(3)))
+    >>> loop = asyncio.new_event_loop()
+    >>> loop.run_until_complete(main())  # the three calls share one draw of "3/7"
+    [False, True, False]
+    >>> ap.probability.history
+    {'3/7': [False, True, False]}
+    >>> ap.probability.count_values()
+    {True: 0, False: 1}
+    """
+
+    def __init__(
+        self, probability: Optional[Probability] = None, batch: int = 64
+    ) -> None:
+        if batch < 1:
+            raise exceptions.InvalidParameterValue(
+                "The batch parameter must be at least one."
+            )
+        self.probability = Probability() if probability is None else probability
+        self._batch = batch
+        self._buffers: Dict[
+            Tuple[type, Union[int, float, str]], List[bool]
+        ] = {}
+
+    def __str__(self) -> str:
+        return str(f"AsyncProbability(probability={self.probability})")
+
+    def _key(self, spec: Union[int, float, str, None]) -> Union[int, float, str]:
+        if spec is None:
+            if self.probability._constant == "unset":
+                raise exceptions.NotGivenValueError(
+                    "No value was given and no constant was set."
+                )
+            spec = self.probability._constant
+        elif isinstance(spec, bool) or not isinstance(spec, (int, float, str)):
+            raise exceptions.ProbabilityTypeError(
+                "The type which you gave must be int, float, or str."
+            )
+        if isinstance(spec, str):
+            return self.probability._adjust_str(spec)
+        return spec
+
+    def _record(self, key: Union[int, float, str], value: bool) -> None:
+        self.probability._record(key, [value])
+        self.probability._last_values = [value]
+
+    async def decide(self, spec: Union[int, float, str, None] = None) -> bool:
+        """
+        Asynchronous decision function that returns True or False based on the given probability.
+        The calls for the same probability are served from one batched draw.
+
+        Args:
+            spec (Union[int, float, str, None], optional): The probability. If it is not given, the constant of the wrapped instance at the time decide starts running is used. Defaults to None.
+
+        Raises:
+            NotGivenValueError: When no value was given and no constant was set
+            ProbabilityTypeError: When the type of the given value is not among int, float, or str
+
+        Returns:
+            bool: The drawn value.
+
+        Examples:
+            >>> import asyncio
+            >>> from pyprobs import AsyncProbability
+            >>> ap = AsyncProbability()
+            >>> ap.probability.set_constant("50%")
+            >>> async def main():
+            ...     return await ap.decide(0.25), await ap.decide()
+            >>> loop = asyncio.new_event_loop()
+            >>> loop.run_until_complete(main())
+            (False, True)
+        """
+        key = self._key(spec)
+        buffer = self._buffers.get((type(key), key))
+        if not buffer:
+            buffer = self._buffers[(type(key), key)] = self.probability._draw(
+                key, self._batch
+            )
+        value = buffer.pop()
+        self._record(key, value)
+        return value
+
+    async def stream(
+        self,
+        spec: Union[int, float, str, None] = None,
+        num: Optional[int] = None,
+        maxsize: int = 64,
+    ) -> AsyncIterator[bool]:
+        """
+        Asynchronous generator that yields the decisions for the given probability.
+        The values are drawn in the background, maxsize values in one pass, and put into a bounded queue,
+        so the producer waits when the consumer falls behind.
+        A value is added to the history only when it is yielded, as if it was drawn with iprob at that moment.
+
+        Args:
+            spec (Union[int, float, str, None], optional): The probability. If it is not given, the constant of the wrapped instance at the time the stream starts is used. Defaults to None.
+            num (Optional[int], optional): The number of how many values will be yielded. If it is not given, the stream does not end. Defaults to None.
+            maxsize (int, optional): The maximum number of values waiting in the queue. Defaults to 64.
+
+        Raises:
+            NumError: When the num parameter was less than one
+            InvalidParameterValue: When the maxsize parameter was less than one
+            NotGivenValueError: When no value was given and no constant was set
+            ProbabilityTypeError: When the type of the given value is not among int, float, or str
+
+        Yields:
+            bool: The drawn values.
+
+        Examples:
+            >>> import asyncio
+            >>> from pyprobs import AsyncProbability
+            >>> ap = AsyncProbability()
+            >>> async def main():
+            ...     return [value async for value in ap.stream("25%", num=3)]
+            >>> loop = asyncio.new_event_loop()
+            >>> loop.run_until_complete(main())
+            [False, True, False]
+        """
+        if num is not None and num < 1:
+            raise exceptions.NumError("The num parameter must be at least one.")
+        if maxsize < 1:
+            raise exceptions.InvalidParameterValue(
+                "The maxsize parameter must be at least one."
+            )
+        key = self._key(spec)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        done = object()
+
+        async def produce() -> None:
+            remaining = num
+            try:
+                while remaining is None or remaining > 0:
+                    size = maxsize if remaining is None else min(maxsize, remaining)
+                    for value in self.probability._draw(key, size):
+                        await queue.put(value)
+                    if remaining is not None:
+                        remaining -= size
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(done)
+
+        producer = asyncio.get_event_loop().create_task(produce())
+        try:
+            while True:
+                value = await queue.get()
+                if value is done:
+                    break
+                if isinstance(value, Exception):
+                    raise value
+                self._record(key, value)
+                yield value
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
@@ -1,6 +1,6 @@
-from random import randint as _randint
+from random import randint as _randint, random as _random
 from . import exceptions
-from typing import Union, Iterable, Dict
+from typing import Union, Iterable, Dict, List
 
 
 class Probability(object):
@@ -154,6 +154,56 @@ class Probability(object):
             return "%".join(arg_as_list)
         return arg
 
+    @staticmethod
+    def _random_draws(first_part: int, second_part: int, num: int) -> List[bool]:
+        if second_part < 1:
+            raise ValueError(f"empty range for draws (1, {second_part})")
+        return [int(_random() * second_part) < first_part for _ in range(num)]
+
+    @classmethod
+    def _draw(cls, arg: Union[int, float, str], num: int) -> List[bool]:
+        """
+        Draws num values for the given probability in one pass, like iprob does for a single arg,
+        but without touching the history.
+        """
+        if isinstance(arg, int):
+            return [cls._int_probability(arg)] * num
+        elif isinstance(arg, float):
+            if arg % 1 == 0 or arg > 1 or arg < 0:
+                return [cls._float_probability(arg)] * num
+            second_part = str(arg).split(".")[1]
+            return cls._random_draws(int(second_part), 10 ** len(second_part), num)
+        elif isinstance(arg, str):
+            if "%" in arg and "/" in arg:
+                raise exceptions.ProbabilityTypeError(
+                    "Given str value must contain '%' or '/'."
+                )
+
+            if "%" in arg:
+                arg = (
+                    arg.split("%")[1].strip()
+                    if arg[0] == "%"
+                    else arg.split("%")[0].strip()
+                )
+                return cls._draw(int(arg.strip()) / 100, num)
+            elif "/" in arg:
+                splitted_arg = arg.split("/")
+                return cls._random_draws(
+                    int(splitted_arg[0]), int(splitted_arg[1]), num
+                )
+            raise exceptions.ProbabilityTypeError(
+                "Given str value must contain '%' or '/'."
+            )
+        raise exceptions.ProbabilityTypeError(
+            "The type which you gave to iprob must be int, float, or str."
+        )
+
+    def _record(self, arg: Union[int, float, str], values: List[bool]) -> None:
+        if arg not in self.history.keys():
+            self.history.update({arg: values})
+        else:
+            self.history[arg].extend(values)
+
     @classmethod
     def prob(cls, *args, num: int = 1) -> Union[bool, Iterable[bool]]:
         """
@@ -0,0 +1,185 @@
+import asyncio
+import pytest
+from pyprobs import AsyncProbability
+from pyprobs import exceptions
+
+# asyncio.all_tasks was added in Python 3.7, Task.all_tasks was removed in 3.9
+all_tasks = getattr(asyncio, "all_tasks", None) or asyncio.Task.all_tasks
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def spy_draw(ap, monkeypatch):
+    calls = []
+    draw = ap.probability._draw
+
+    def spy(arg, num):
+        calls.append((arg, num))
+        return draw(arg, num)
+
+    monkeypatch.setattr(ap.probability, "_draw", spy)
+    return calls
+
+
+def test_decide_batches_same_spec(monkeypatch):
+    ap = AsyncProbability(batch=5)
+    calls = spy_draw(ap, monkeypatch)
+
+    async def main():
+        return await asyncio.gather(*(ap.decide(" 3 / 7 ") for _ in range(7)))
+
+    values = run(main())
+    assert calls == [("3/7", 5), ("3/7", 5)]
+    assert len(values) == 7
+    assert ap.probability.history == {"3/7": values}
+    assert ap.probability.count_values() == {
+        True: values[-1],
+        False: not values[-1],
+    }
+    assert ap.probability.count_values("all") == {
+        True: values.count(True),
+        False: values.count(False),
+    }
+
+
+def test_decide_distinct_specs(monkeypatch):
+    ap = AsyncProbability()
+    calls = spy_draw(ap, monkeypatch)
+
+    async def main():
+        return await asyncio.gather(
+            ap.decide(1), ap.decide(1), ap.decide(1.0), ap.decide(0)
+        )
+
+    assert run(main()) == [True, True, True, False]
+    assert calls == [(1, 64), (1.0, 64), (0, 64)]
+    assert [type(arg) for arg, _ in calls] == [int, float, int]
+    assert ap.probability.history == {1: [True, True, True], 0: [False]}
+    assert ap.probability.count_values() == {True: 0, False: 1}
+
+
+def test_decide_uses_constant():
+    ap = AsyncProbability()
+    ap.probability.set_constant("100%")
+    assert run(ap.decide()) is True
+    assert ap.probability.history == {"100%": [True]}
+
+
+def test_decide_follows_constant():
+    ap = AsyncProbability()
+    ap.probability.set_constant(1)
+
+    async def main():
+        first = await ap.decide()
+        ap.probability.set_constant(0)  # the values left in the batch of 1 are not used
+        return first, await ap.decide()
+
+    assert run(main()) == (True, False)
+    assert ap.probability.history == {1: [True], 0: [False]}
+
+
+def test_decide_error_reaches_every_call():
+    ap = AsyncProbability()
+
+    async def main():
+        return await asyncio.gather(
+            ap.decide("a/b"), ap.decide("a/b"), return_exceptions=True
+        )
+
+    assert all(isinstance(error, ValueError) for error in run(main()))
+
+
+def test_decide_error_keeps_last_values():
+    ap = AsyncProbability()
+    run(ap.decide(1))
+    with pytest.raises(exceptions.ProbabilityRangeError):
+        run(ap.decide(2))
+    assert ap.probability.count_values() == {True: 1, False: 0}
+
+    ap = AsyncProbability()
+    with pytest.raises(exceptions.ProbabilityRangeError):
+        run(ap.decide(2))
+    with pytest.raises(exceptions.NotUsedError):
+        ap.probability.count_values()
+
+
+@pytest.mark.parametrize(
+    "spec,error",
+    [
+        (None, exceptions.NotGivenValueError),
+        (2, exceptions.ProbabilityRangeError),
+        ([0.5], exceptions.ProbabilityTypeError),
+        (True, exceptions.ProbabilityTypeError),
+    ],
+)
+def test_decide_errors(spec, error):
+    with pytest.raises(error):
+        run(AsyncProbability().decide(spec))
+
+
+def test_batch_error():
+    with pytest.raises(exceptions.InvalidParameterValue):
+        AsyncProbability(batch=0)
+
+
+def test_stream_len(monkeypatch):
+    ap = AsyncProbability()
+    calls = spy_draw(ap, monkeypatch)
+
+    async def main():
+        return [value async for value in ap.stream("25%", num=7, maxsize=3)]
+
+    values = run(main())
+    assert len(values) == 7
+    assert [num for _, num in calls] == [3, 3, 1]
+    assert ap.probability.history == {"25%": values}
+
+
+def test_stream_backpressure(monkeypatch):
+    ap = AsyncProbability()
+    calls = spy_draw(ap, monkeypatch)
+
+    async def main():
+        stream = ap.stream(1, maxsize=2)
+        assert await stream.__anext__() is True
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await stream.aclose()
+        return [task for task in all_tasks() if not task.done()]
+
+    assert len(run(main())) == 1  # only main() itself
+    # the producer stopped after two draws of maxsize values
+    assert calls == [(1, 2), (1, 2)]
+    # only the consumed value is recorded
+    assert ap.probability.history == {1: [True]}
+
+
+def test_stream_producer_error():
+    async def main():
+        async for _ in AsyncProbability().stream(2, num=3):
+            pass
+
+    with pytest.raises(exceptions.ProbabilityRangeError):
+        run(main())
+
+
+@pytest.mark.parametrize(
+    "kwargs,error",
+    [
+        ({"num": 0}, exceptions.NumError),
+        ({"maxsize": 0}, exceptions.InvalidParameterValue),
+    ],
+)
+def test_stream_errors(kwargs, error):
+    async def main():
+        async for _ in AsyncProbability().stream(0.5, **kwargs):
+            pass
+
+    with pytest.raises(error):
+        run(main())